@@ -1,17 +1,149 @@
 import os
+import re
+import hashlib
 import numpy as np
 import segyio
 import time
 
-def read_sgy_selective(filepath, endian='big'):
+def _sgy_cache_path(filepath, endian):
+    """
+    Path of the .npy cache for a SEG-Y file. The endian is part of the file name and the
+    key hashes the absolute path, mtime and size, so every spelling of the same path
+    shares one cache per endian.
+    """
+    filepath = os.path.abspath(filepath)
+    stat = os.stat(filepath)
+    key = hashlib.md5(f"{filepath}:{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()[:16]
+    return f"{filepath}.{endian}.{key}.npy"
+
+def _remove_stale_sgy_caches(filepath, endian, cache_path):
+    """
+    Delete cache files of a SEG-Y file written with the same endian but for another key.
+    """
+    folder, name = os.path.split(os.path.abspath(filepath))
+    pattern = re.compile(re.escape(f"{name}.{endian}.") + r"[0-9a-f]{16}\.npy(\.il\.npy|\.xl\.npy|\.tmp)?")
+    current = os.path.basename(cache_path)
+    for f in os.listdir(folder):
+        if pattern.fullmatch(f) and not f.startswith(current):
+            os.remove(os.path.join(folder, f))
+
+def read_sgy_selective(filepath, endian='big', mmap=False, cache=False):
+    """
+    Read all traces of a SEG-Y file together with their inline/crossline numbers.
+
+    Args:
+        filepath (str): Path to the .sgy file
+        endian (str): Byte order of the file, 'big' or 'little'
+        mmap (bool): Memory-map the file while reading
+        cache (bool): Keep a .npy copy of the traces next to the SEG-Y file and load it
+                      memory-mapped on later calls. This needs as much free disk space as
+                      the decoded cube, in the same folder as the source file. Caches from
+                      older versions of the file with the same endian are removed when a
+                      new one is written
+
+    Returns:
+        tuple: (traces, il, xl) with traces of shape (tracecount, samples)
+    """
+    if cache:
+        cache_path = _sgy_cache_path(filepath, endian)
+        if os.path.exists(cache_path):
+            # Copy-on-write so callers can modify traces in place as on an uncached read
+            return (np.load(cache_path, mmap_mode='c'),
+                    np.load(cache_path + '.il.npy'),
+                    np.load(cache_path + '.xl.npy'))
+
     with segyio.open(filepath, mode='r', endian=endian, ignore_geometry=True) as src:
-        traces = segyio.tools.collect(src.trace[:])
-        # traces = 123
+        if mmap:
+            src.mmap()
+        # Read all traces in one pass straight into a (tracecount, samples) buffer
+        traces = src.trace.raw[:]
         # Select only needed fields (still vectorized)
         il = src.attributes(segyio.TraceField.INLINE_3D)[:]
         xl = src.attributes(segyio.TraceField.CROSSLINE_3D)[:]
+
+    if cache:
+        try:
+            _remove_stale_sgy_caches(filepath, endian, cache_path)
+            # Headers first and traces via rename, so an existing cache file is always complete
+            np.save(cache_path + '.il.npy', il)
+            np.save(cache_path + '.xl.npy', xl)
+            with open(cache_path + '.tmp', 'wb') as f:
+                np.save(f, traces)
+            os.replace(cache_path + '.tmp', cache_path)
+        except OSError as e:
+            if os.path.exists(cache_path + '.tmp'):
+                os.remove(cache_path + '.tmp')
+            print(f"Could not write cache '{cache_path}': {e}")
     return traces, il, xl
 
+def read_sgy_slice(filepath, il_range, xl_range, t_range, endian='big'):
+    """
+    Read only a subcube of a SEG-Y file instead of the whole volume.
+
+    Args:
+        filepath (str): Path to the .sgy file
+        il_range (slice): Positions in the sorted list of inline numbers
+        xl_range (slice): Positions in the sorted list of crossline numbers
+        t_range (slice): Sample positions along each trace
+
+    Returns:
+        tuple: (cube, ils, xls, offsets) where cube has shape
+               (len(ils), len(xls), len(offsets), samples). Pre-stack gathers keep one
+               trace per offset; missing traces are left as zeros
+
+    Raises:
+        ValueError: If several selected traces share the same inline, crossline and offset
+    """
+    with segyio.open(filepath, mode='r', endian=endian, ignore_geometry=True) as src:
+        src.mmap()
+        il = src.attributes(segyio.TraceField.INLINE_3D)[:]
+        xl = src.attributes(segyio.TraceField.CROSSLINE_3D)[:]
+        off = src.attributes(segyio.TraceField.offset)[:]
+        ils = np.unique(il)[il_range]
+        xls = np.unique(xl)[xl_range]
+        offsets = np.unique(off)
+        n_samples = len(range(len(src.samples))[t_range])
+
+        cube = np.zeros((len(ils), len(xls), len(offsets), n_samples), dtype=np.float32)
+        # Only touch the traces that fall inside the requested inline/crossline set
+        selected = np.flatnonzero(np.isin(il, ils) & np.isin(xl, xls))
+        # ils/xls are descending for negative-step ranges, so search through a sorting permutation
+        il_order = np.argsort(ils)
+        xl_order = np.argsort(xls)
+        i_idx = il_order[np.searchsorted(ils, il[selected], sorter=il_order)]
+        x_idx = xl_order[np.searchsorted(xls, xl[selected], sorter=xl_order)]
+        o_idx = np.searchsorted(offsets, off[selected])
+
+        # A repeated (il, xl, offset) would silently overwrite an earlier trace
+        cells = (i_idx * len(xls) + x_idx) * len(offsets) + o_idx
+        if np.unique(cells).size != cells.size:
+            raise ValueError(f"'{filepath}' has several traces with the same inline, crossline and offset")
+
+        for tr, i, x, o in zip(selected, i_idx, x_idx, o_idx):
+            # Decode only the requested samples of the trace
+            cube[i, x, o] = src.trace[tr, t_range]
+    return cube, ils, xls, offsets
+
+def _has_multiple_values(array, block_size=1_000_000):
+    """
+    Check whether an array holds more than one distinct value, stopping at the first mismatch.
+    """
+    # order='A' keeps Fortran-ordered (memory-mapped) arrays as a view instead of a copy
+    flat = array.reshape(-1, order='A')
+    if flat.size == 0:
+        return False
+    first = flat[0]
+    # Match np.unique, which treats all NaNs as one value
+    nan_aware = np.issubdtype(flat.dtype, np.inexact)
+    for start in range(0, flat.size, block_size):
+        block = flat[start:start + block_size]
+        same = block == first
+        if nan_aware:
+            same |= np.isnan(block) & np.isnan(first)
+        if not np.all(same):
+            return True
+    return False
+
 def find_viable_arrays(folder_path):
     """
     Cycle through .npy files in a folder and return arrays with more than 1 unique value.
@@ -42,18 +174,16 @@ def find_viable_arrays(folder_path):
         file_path = os.path.join(folder_path, filename)
         
         try:
-            # Load the array
-            array = np.load(file_path)
-            
-            # Count unique values
-            unique_values = np.unique(array)
+            # Memory-map the array so only the pages touched by the check are read
+            array = np.load(file_path, mmap_mode='r', allow_pickle=False)
             
             # Check if array has more than 1 unique value
-            if len(unique_values) > 1:
+            if _has_multiple_values(array):
                 valid_arrays.append((filename))
-                print(f"✓ {filename}: {len(unique_values)} unique values")
+                print(f"✓ {filename}: multiple unique values")
             else:
-                print(f"✗ {filename}: Only 1 unique value ({unique_values[0]})")
+                print(f"✗ {filename}: Only 1 unique value ({array.flat[0]})")
+            del array
                 
         except Exception as e:
             print(f"Error loading {filename}: {e}")
@@ -1,33 +1,84 @@
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider
+from matplotlib.colors import Normalize
 import numpy as np
 
+def _blit_redraw(fig, artists):
+    """
+    Set up blitting for the given artists. Returns a function that redraws only them
+    on top of a cached background instead of redrawing the whole figure. Canvases
+    without blitting support fall back to a full redraw.
+    """
+    if not fig.canvas.supports_blit:
+        return fig.canvas.draw_idle
+
+    cache = {'bg': None}
+
+    def on_draw(event):
+        cache['bg'] = fig.canvas.copy_from_bbox(fig.bbox)
+        for artist in artists:
+            fig.draw_artist(artist)
+
+    fig.canvas.mpl_connect('draw_event', on_draw)
+
+    def redraw():
+        if cache['bg'] is None:
+            fig.canvas.draw_idle()
+            return
+        fig.canvas.restore_region(cache['bg'])
+        for artist in artists:
+            fig.draw_artist(artist)
+        fig.canvas.blit(fig.bbox)
+
+    return redraw
+
+def _display_stride(ax, n_rows, n_cols):
+    """
+    Stride that keeps a displayed slice at about twice the pixel size of the axes.
+    """
+    sy = max(1, n_rows // max(1, int(2 * ax.bbox.height)))
+    sx = max(1, n_cols // max(1, int(2 * ax.bbox.width)))
+    return sy, sx
+
 def plot_3d_slices(array_3d, seismic):
     """
     Plot 3d array right next to seismic. Also has a slider for choosing the inline
     """
     fig, axs = plt.subplots(1,2)
     plt.subplots_adjust(bottom=0.2)
+    # Artists redrawn per slider step are only animated when the canvas can blit
+    blit = fig.canvas.supports_blit
     
+    # Color scales fixed to the whole volumes so they are not recomputed per slice
+    norm1 = Normalize(vmin=array_3d.min(), vmax=array_3d.max())
+    norm2 = Normalize(vmin=seismic.min(), vmax=seismic.max())
+
     # Initial slice
     initial_slice = 0
-    im1 = axs[0].imshow(array_3d[:, initial_slice, :], cmap='viridis', aspect='auto')
-    axs[0].set_title(f'Slice {initial_slice}')
-    im2 = ax.imshow(seismic[:, initial_slice, :], cmap='seismic', aspect='auto')
-    ax.set_title(f'Slice {initial_slice}')
+    im1 = axs[0].imshow(array_3d[:, initial_slice, :], cmap='viridis', aspect='auto',
+                        norm=norm1, animated=blit)
+    title1 = axs[0].set_title(f'Slice {initial_slice}', animated=blit)
+    im2 = axs[1].imshow(seismic[:, initial_slice, :], cmap='seismic', aspect='auto',
+                        norm=norm2, animated=blit)
+    title2 = axs[1].set_title(f'Slice {initial_slice}', animated=blit)
 
     
     # Slider
     ax_slider = plt.axes([0.2, 0.05, 0.6, 0.03])
     slider = Slider(ax_slider, 'Slice', 0, array_3d.shape[1] - 1, valinit=0, valfmt='%d')
+    # The slider is redrawn in update, blitted when the canvas supports it
+    slider.drawon = False
+    # Keep the slider out of the cached background so its value text and handle are not ghosted
+    ax_slider.set_animated(blit)
+    redraw = _blit_redraw(fig, [im1, title1, im2, title2, ax_slider])
     
     def update(val):
         slice_num = int(slider.val)
         im1.set_array(array_3d[:, slice_num, :])
-        axs[0].set_title(f'Slice {slice_num}')
+        title1.set_text(f'Slice {slice_num}')
         im2.set_array(seismic[:, slice_num, :])
-        ax.set_title(f'Slice {slice_num}')
-        fig.canvas.draw()
+        title2.set_text(f'Slice {slice_num}')
+        redraw()
     
     slider.on_changed(update)
     plt.show()
@@ -38,22 +89,39 @@ def plot_3d_seismic(seismic):
     """
     fig, ax = plt.subplots()
     plt.subplots_adjust(bottom=0.2)
+    # Artists redrawn per slider step are only animated when the canvas can blit
+    blit = fig.canvas.supports_blit
     
-    # Initial slice
+    # Slices larger than the canvas are decimated for display, extent keeps original indices
+    stride = list(_display_stride(ax, seismic.shape[0], seismic.shape[2]))
+    extent = (-0.5, seismic.shape[2] - 0.5, seismic.shape[0] - 0.5, -0.5)
+
+    # Initial slice, color scale fixed to the whole cube so it is not recomputed per slice
     initial_slice = 0
-    im2 = ax.imshow(seismic[:, initial_slice, :], cmap='seismic', aspect='auto')
-    ax.set_title(f'Slice {initial_slice}')
+    im2 = ax.imshow(seismic[::stride[0], initial_slice, ::stride[1]], cmap='seismic', aspect='auto',
+                    extent=extent, vmin=seismic.min(), vmax=seismic.max(), animated=blit)
+    title = ax.set_title(f'Slice {initial_slice}', animated=blit)
 
     
     # Slider
     ax_slider = plt.axes([0.2, 0.05, 0.6, 0.03])
     slider = Slider(ax_slider, 'Slice', 0, seismic.shape[1] - 1, valinit=0, valfmt='%d')
+    # The slider is redrawn in update, blitted when the canvas supports it
+    slider.drawon = False
+    # Keep the slider out of the cached background so its value text and handle are not ghosted
+    ax_slider.set_animated(blit)
+    redraw = _blit_redraw(fig, [im2, title, ax_slider])
     
     def update(val):
         slice_num = int(slider.val)
-        im2.set_array(seismic[:, slice_num, :])
-        ax.set_title(f'Slice {slice_num}')
-        fig.canvas.draw()
+        im2.set_array(seismic[::stride[0], slice_num, ::stride[1]])
+        title.set_text(f'Slice {slice_num}')
+        redraw()
+
+    def on_resize(event):
+        stride[:] = _display_stride(ax, seismic.shape[0], seismic.shape[2])
+        im2.set_array(seismic[::stride[0], int(slider.val), ::stride[1]])
     
+    fig.canvas.mpl_connect('resize_event', on_resize)
     slider.on_changed(update)
     plt.show()
\ No newline at end of file